@@ -14,6 +14,7 @@ from aiohttp import ClientSession
 from pulsegen_client import *
 
 PORT = 5000
+CONCURRENCY = 8
 
 
 async def gen_n(n: int, client: PulseGenAsyncClient):
@@ -69,9 +70,10 @@ async def gen_n(n: int, client: PulseGenAsyncClient):
 async def main():
     async with ClientSession() as session:
         client = PulseGenAsyncClient(session, port=PORT)
-        for i in cycle(range(1, 100)):
-            print(i)
-            await gen_n(i, client)
+        for start in cycle(range(1, 100, CONCURRENCY)):
+            stop = min(start + CONCURRENCY, 100)
+            print(f"{start}-{stop - 1}")
+            await asyncio.gather(*(gen_n(i, client) for i in range(start, stop)))
 
 
 if __name__ == "__main__":
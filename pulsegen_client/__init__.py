@@ -12,9 +12,10 @@ client.
     This package is still in development and the API may change in the future.
 """
 
-from .client import PulseGenAsyncClient, PulseGenClient
+import importlib as _importlib
+import typing as _typing
+
 from .contracts import Biquad, ChannelInfo, IqCalibration, Options
-from .runner import run_schedule
 from .schedule import (
     Absolute,
     Alignment,
@@ -29,9 +30,39 @@ from .schedule import (
     ShiftPhase,
     Stack,
     SwapPhase,
+    tile,
 )
 from .shape import HannShape, InterpolatedShape, TriangleShape
 
+if _typing.TYPE_CHECKING:
+    from .client import PulseGenAsyncClient, PulseGenClient
+    from .runner import run_schedule
+
+# The HTTP clients and the local runner pull in aiohttp, requests and scipy,
+# which dominate import time, so they are loaded on first access.
+_LAZY_ATTRS = {
+    "PulseGenAsyncClient": ".client",
+    "PulseGenClient": ".client",
+    "run_schedule": ".runner",
+}
+_LAZY_SUBMODULES = ("client", "runner")
+
+
+def __getattr__(name: str) -> _typing.Any:
+    if name in _LAZY_SUBMODULES:
+        return _importlib.import_module(f".{name}", __name__)
+    module = _LAZY_ATTRS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(_importlib.import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> _typing.List[str]:
+    return sorted({*globals(), *__all__, *_LAZY_SUBMODULES})
+
+
 __all__ = [
     "PulseGenAsyncClient",
     "PulseGenClient",
@@ -53,6 +84,7 @@ __all__ = [
     "ShiftPhase",
     "Stack",
     "SwapPhase",
+    "tile",
     "HannShape",
     "InterpolatedShape",
     "TriangleShape",
@@ -12,6 +12,7 @@ import pulsegen_client.schedule as _schedule
 
 SCHEDULE_ENDPOINT = "/api/schedule"
 MIME_TYPE = "application/msgpack"
+_HEADERS = {"Content-Type": MIME_TYPE}
 
 
 def _unpack_response(
@@ -55,6 +56,7 @@ class PulseGenClient:
         self._hostname = hostname
         self._port = port
         self._session = session
+        self._url = f"http://{hostname}:{port}{SCHEDULE_ENDPOINT}"
 
     def run_schedule(
         self, request: _schedule.Request
@@ -66,9 +68,7 @@ class PulseGenClient:
             values are tuples of (I, Q) arrays.
         """
         msg = request.packb()
-        url = f"http://{self._hostname}:{self._port}{SCHEDULE_ENDPOINT}"
-        headers = {"Content-Type": MIME_TYPE}
-        response = self._session.post(url, data=msg, headers=headers)
+        response = self._session.post(self._url, data=msg, headers=_HEADERS)
         response.raise_for_status()
         return _unpack_response(request.channels, response.content)
 
@@ -90,6 +90,7 @@ class PulseGenAsyncClient:
         self._hostname = hostname
         self._port = port
         self._session = session
+        self._url = f"http://{hostname}:{port}{SCHEDULE_ENDPOINT}"
 
     async def run_schedule(
         self, request: _schedule.Request
@@ -101,9 +102,9 @@ class PulseGenAsyncClient:
             values are tuples of (I, Q) arrays.
         """
         msg = request.packb()
-        url = f"http://{self._hostname}:{self._port}{SCHEDULE_ENDPOINT}"
-        headers = {"Content-Type": MIME_TYPE}
-        async with self._session.post(url, data=msg, headers=headers) as response:
+        async with self._session.post(
+            self._url, data=msg, headers=_HEADERS
+        ) as response:
             response.raise_for_status()
             content = await response.read()
         return _unpack_response(request.channels, content)
@@ -1,10 +1,14 @@
 """Data contracts for the pulsegen service."""
 
 import enum as _enum
+import functools as _functools
+import operator as _operator
 import typing as _typing
+import weakref as _weakref
 
 import attrs as _attrs
 import msgpack as _msgpack
+import numpy as _np
 
 
 @_attrs.frozen
@@ -19,19 +23,108 @@ class MsgObject:
     @property
     def data(self) -> tuple:
         """The data of the message object to be serialized."""
-        return _attrs.astuple(self, recurse=False)
+        return _fields_getter(type(self))(self)
 
     def packb(self) -> bytes:
         """Serialize the message object to bytes in msgpack format."""
+        try:
+            return _msgpack.packb(self, default=_encode)  # type: ignore
+        except ValueError as error:
+            # Only retry nesting deeper than the C packer's recursion limit.
+            if "recursion limit exceeded" not in str(error):
+                raise
+            return _packb_iterative(self)
+
+
+def _packb_iterative(obj: _typing.Any) -> bytes:
+    """Serialize like :func:`msgpack.packb` with an explicit stack."""
+    packer = _msgpack.Packer(default=_encode)
+    chunks = []
+    pending = [obj]
+    while pending:
+        item = pending.pop()
+        if isinstance(item, MsgObject):
+            item = _encode(item)
+        if type(item) is list or type(item) is tuple:
+            chunks.append(packer.pack_array_header(len(item)))
+            pending.extend(reversed(item))
+        else:
+            chunks.append(packer.pack(item))
+    return b"".join(chunks)
+
+
+def packb_cached(obj: MsgObject) -> bytes:
+    """Serialize a message object, reusing the bytes from a previous call.
+
+    The bytes are kept for as long as the object is alive. Only use this for
+    objects whose content cannot change, i.e. without mutable containers.
+    """
+    key = id(obj)
+    entry = _PACKED.get(key)
+    if entry is not None and entry[0]() is obj:
+        return entry[1]
+    packed = _msgpack.packb(obj, default=_encode)
+    ref = _weakref.ref(obj, lambda _, key=key: _PACKED.pop(key, None))
+    _PACKED[key] = (ref, packed)
+    return packed
+
+
+_PACKED: _typing.Dict[int, _typing.Tuple[_weakref.ref, bytes]] = {}
+
+
+def packb_array_cached(items: _typing.Sequence[MsgObject]) -> bytes:
+    """Serialize a list of message objects with :func:`packb_cached`."""
+    return packb_array_header(len(items)) + b"".join(map(packb_cached, items))
+
 
-        def encode(obj: _typing.Union[MsgObject, _enum.Enum]):
-            if isinstance(obj, MsgObject):
-                return obj.data
-            if isinstance(obj, _enum.Enum):
-                return obj.value
-            raise TypeError(f"Cannot encode object of type {type(obj)}")
+def packb_array_header(length: int) -> bytes:
+    """Serialize the header of a msgpack array with the given length."""
+    return _HEADER_PACKER.pack_array_header(length)
 
-        return _msgpack.packb(self, default=encode)  # type: ignore
+
+_HEADER_PACKER = _msgpack.Packer()
+
+
+@_functools.lru_cache(maxsize=None)
+def _fields_getter(cls: type) -> _typing.Callable[[MsgObject], tuple]:
+    """Return a C-level getter for the field values of an attrs class.
+
+    Fields with ``init=False`` hold cached values and are not serialized.
+    """
+    names = [field.name for field in _attrs.fields(cls) if field.init]
+    if not names:
+        return lambda obj: ()
+    if len(names) == 1:
+        getter = _operator.attrgetter(names[0])
+        return lambda obj: (getter(obj),)
+    return _operator.attrgetter(*names)
+
+
+_ENCODERS: _typing.Dict[type, _typing.Callable[[_typing.Any], _typing.Any]] = {}
+
+
+def _encode(obj: _typing.Union[MsgObject, _enum.Enum, _np.ndarray]):
+    encoder = _ENCODERS.get(type(obj))
+    if encoder is None:
+        encoder = _ENCODERS[type(obj)] = _make_encoder(type(obj))
+    return encoder(obj)
+
+
+def _make_encoder(cls: type) -> _typing.Callable[[_typing.Any], _typing.Any]:
+    """Build the msgpack ``default`` hook for one concrete type."""
+    if issubclass(cls, MsgObject):
+        if cls.data is UnionObject.data:
+            type_id = cls.TYPE_ID  # type: ignore
+            getter = _fields_getter(cls)
+            return lambda obj: (type_id, getter(obj))
+        if cls.data is MsgObject.data:
+            return _fields_getter(cls)
+        return lambda obj: obj.data
+    if issubclass(cls, _enum.Enum):
+        return lambda obj: obj.value
+    if issubclass(cls, _np.ndarray):
+        return lambda obj: obj.tolist()
+    raise TypeError(f"Cannot encode object of type {cls}")
 
 
 @_attrs.frozen
@@ -147,9 +240,9 @@ class ChannelInfo(MsgObject):
     align_level: int
     """The alignment level of the channel."""
     iq_calibration: _typing.Optional[IqCalibration] = None
-    iir: _typing.List[Biquad] = _attrs.field(factory=list, converter=list)
+    iir: _typing.Tuple[Biquad, ...] = _attrs.field(factory=tuple, converter=tuple)
     """The biquad filter chain of the channel."""
-    fir: _typing.List[float] = _attrs.field(factory=list, converter=list)
+    fir: _typing.Tuple[float, ...] = _attrs.field(factory=tuple, converter=tuple)
     """The FIR filter of the channel."""
 
 
@@ -105,10 +105,14 @@ def create_layout_manager(element: schedule.Element) -> LayoutManager:
             element, 0, {element.channel_id1, element.channel_id2}
         )
     if isinstance(element, schedule.Barrier):
-        return SimpleLayoutManager(element, 0, set(element.channel_ids))
+        return SimpleLayoutManager(element, 0, set(element.channel_ids.tolist()))
     raise ValueError(f"Unknown element type: {type(element)}")
 
 
+def _visible(layouts: List[LayoutManager]) -> List[LayoutManager]:
+    return [layout for layout in layouts if layout.element.visibility]
+
+
 class SimpleLayoutManager(LayoutManager):
     def __init__(
         self, element: schedule.Element, duration: float, channels: Set[int]
@@ -132,17 +136,9 @@ class SimpleLayoutManager(LayoutManager):
     ) -> None:
         element = self.element
         if isinstance(element, schedule.Play):
-            shape = None if element.shape_id == -1 else shapes[element.shape_id]
-            assert self.actual_duration is not None
-            plateau = (
-                self.actual_duration - element.width
-                if element.flexible
-                else element.plateau
-            )
-            envelope = Envelope(shape, element.width, plateau)
             tracker.play(
                 element.channel_id,
-                envelope,
+                self._envelope(shapes),
                 element.frequency,
                 element.phase,
                 element.amplitude,
@@ -164,6 +160,43 @@ class SimpleLayoutManager(LayoutManager):
         else:
             raise ValueError(f"Unknown instruction type: {type(element)}")
 
+    def render_strided(
+        self,
+        time: float,
+        stride: float,
+        count: int,
+        tracker: PhaseTracker,
+        shapes: List[PulseShape],
+    ) -> None:
+        element = self.element
+        assert isinstance(element, schedule.Play)
+        if not element.visibility:
+            return
+        assert self.actual_time is not None
+        tracker.play_strided(
+            element.channel_id,
+            self._envelope(shapes),
+            element.frequency,
+            element.phase,
+            element.amplitude,
+            element.drag_coef,
+            time + self.actual_time,
+            stride,
+            count,
+        )
+
+    def _envelope(self, shapes: List[PulseShape]) -> Envelope:
+        element = self.element
+        assert isinstance(element, schedule.Play)
+        shape = None if element.shape_id == -1 else shapes[element.shape_id]
+        assert self.actual_duration is not None
+        plateau = (
+            self.actual_duration - element.width
+            if element.flexible
+            else element.plateau
+        )
+        return Envelope(shape, element.width, plateau)
+
 
 class RepeatLayoutManager(LayoutManager):
     def __init__(
@@ -196,13 +229,17 @@ class RepeatLayoutManager(LayoutManager):
         self, time: float, tracker: PhaseTracker, shapes: List[PulseShape]
     ) -> None:
         n = self.element.count
-        if n == 0:
+        if n == 0 or not self.child_layout.element.visibility:
             return
-        child_time = time
         assert self.child_layout.actual_duration is not None
-        for _ in range(n):
-            self.child_layout.render(child_time, tracker, shapes)
-            child_time += self.child_layout.actual_duration + self.element.spacing
+        stride = self.child_layout.actual_duration + self.element.spacing
+        if isinstance(self.child_layout, SimpleLayoutManager) and isinstance(
+            self.child_layout.element, schedule.Play
+        ):
+            self.child_layout.render_strided(time, stride, n, tracker, shapes)
+            return
+        for i in range(n):
+            self.child_layout.render(time + i * stride, tracker, shapes)
 
 
 class StackLayoutManager(LayoutManager):
@@ -214,11 +251,12 @@ class StackLayoutManager(LayoutManager):
         self.element: schedule.Stack
         self.child_layouts = [create_layout_manager(e) for e in element.children]
         self.channels = set().union(*(c.channels for c in self.child_layouts))
+        self.visible_layouts = _visible(self.child_layouts)
 
     def render_override(
         self, time: float, tracker: PhaseTracker, shapes: List[PulseShape]
     ) -> None:
-        for child in self.child_layouts:
+        for child in self.visible_layouts:
             child.render(time, tracker, shapes)
 
     def measure_override(self, available_duration: float) -> float:
@@ -295,20 +333,20 @@ class AbsoluteLayoutManager(LayoutManager):
         self.child_layouts = [
             create_layout_manager(e.element) for e in element.children
         ]
+        self.child_times = [e.time for e in element.children]
         self.channels = set().union(*(c.channels for c in self.child_layouts))
+        self.visible_layouts = _visible(self.child_layouts)
 
     def measure_override(self, available_duration: float) -> float:
         max_time = 0.0
-        child_times = (e.time for e in self.element.children)
-        for child_time, child in zip(child_times, self.child_layouts):
+        for child_time, child in zip(self.child_times, self.child_layouts):
             child.measure(available_duration)
             assert child.desired_duration is not None
             max_time = max(max_time, child.desired_duration + child_time)
         return max_time
 
     def arrange_override(self, time: float, final_duration: float) -> float:
-        child_times = (e.time for e in self.element.children)
-        for child_time, child in zip(child_times, self.child_layouts):
+        for child_time, child in zip(self.child_times, self.child_layouts):
             assert child.desired_duration is not None
             child.arrange(child_time, child.desired_duration)
         return final_duration
@@ -316,7 +354,7 @@ class AbsoluteLayoutManager(LayoutManager):
     def render_override(
         self, time: float, tracker: PhaseTracker, shapes: List[PulseShape]
     ) -> None:
-        for child in self.child_layouts:
+        for child in self.visible_layouts:
             child.render(time, tracker, shapes)
 
 
@@ -327,28 +365,26 @@ class GridLayoutManager(LayoutManager):
         self.child_layouts = [
             create_layout_manager(e.element) for e in element.children
         ]
+        self.child_cells = [(e.column, e.span) for e in element.children]
         self.channels = set().union(*(c.channels for c in self.child_layouts))
+        self.visible_layouts = _visible(self.child_layouts)
         self._min_column_width: Optional[List[float]] = None
-        self._columns = element.columns
+        self._columns = element.columns or (schedule.GridLength.star(1),)
 
     def render_override(
         self, time: float, tracker: PhaseTracker, shapes: List[PulseShape]
     ) -> None:
-        for child in self.child_layouts:
+        for child in self.visible_layouts:
             child.render(time, tracker, shapes)
 
     def measure_override(self, available_duration: float) -> float:
-        if len(self._columns) == 0:
-            self._columns.append(schedule.GridLength.star(1))
         for child in self.child_layouts:
             child.measure(available_duration)
         colsizes = [
             c.value if c.unit == schedule.GridLengthUnit.SECOND else 0.0
             for c in self._columns
         ]
-        for child, (column, span) in zip(
-            self.child_layouts, ((e.column, e.span) for e in self.element.children)
-        ):
+        for child, (column, span) in zip(self.child_layouts, self.child_cells):
             actual_column = min(column, len(colsizes) - 1)
             actual_span = min(span, len(colsizes) - actual_column)
             if actual_span > 1:
@@ -359,9 +395,7 @@ class GridLayoutManager(LayoutManager):
             colsizes[actual_column] = max(
                 colsizes[actual_column], child.desired_duration
             )
-        for child, (column, span) in zip(
-            self.child_layouts, ((e.column, e.span) for e in self.element.children)
-        ):
+        for child, (column, span) in zip(self.child_layouts, self.child_cells):
             actual_column = min(column, len(colsizes) - 1)
             actual_span = min(span, len(colsizes) - actual_column)
             if actual_span == 1:
@@ -407,10 +441,8 @@ class GridLayoutManager(LayoutManager):
         colstarts = [0.0]
         for i in range(len(colsizes) - 1):
             colstarts.append(colstarts[-1] + colsizes[i])
-        for child, (column, span, align) in zip(
-            self.child_layouts,
-            ((e.column, e.span, e.element.alignment) for e in self.element.children),
-        ):
+        for child, (column, span) in zip(self.child_layouts, self.child_cells):
+            align = child.element.alignment
             actual_column = min(column, len(colsizes) - 1)
             actual_span = min(span, len(colsizes) - actual_column)
             assert child.desired_duration is not None
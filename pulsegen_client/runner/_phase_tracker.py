@@ -1,60 +1,40 @@
-from typing import List
-
-from attrs import define, field
+from typing import Callable, List, Optional
 
 from pulsegen_client.runner._pulse_list import PulseList
 from pulsegen_client.runner._shape_impl import Envelope
 
 
-@define
-class _ChannelStatus:
-    base_freq: float
-    delta_freq: float = 0.0
-    phase: float = 0.0
-    pulses: PulseList = field(factory=PulseList)
-
-    @property
-    def total_freq(self) -> float:
-        return self.base_freq + self.delta_freq
-
-    def shift_freq(self, delta: float, time: float) -> None:
-        self.phase -= delta * time
-        self.delta_freq += delta
-
-    def set_freq(self, freq: float, time: float) -> None:
-        self.phase -= (freq - self.delta_freq) * time
-        self.delta_freq = freq
-
-    def shift_phase(self, delta: float) -> None:
-        self.phase += delta
-
-    def set_phase(self, phase: float, time: float) -> None:
-        self.phase = phase - self.delta_freq * time
-
-    @staticmethod
-    def swap_phase(a: "_ChannelStatus", b: "_ChannelStatus", time: float) -> None:
-        diff = a.total_freq - b.total_freq
-        a.phase, b.phase = b.phase - diff * time, a.phase + diff * time
-
-
 class PhaseTracker:
     def __init__(self, base_freqs: List[float]) -> None:
-        self.channels = [_ChannelStatus(base_freq) for base_freq in base_freqs]
+        self.base_freq = [float(f) for f in base_freqs]
+        self.delta_freq = [0.0] * len(base_freqs)
+        self.phase = [0.0] * len(base_freqs)
+        self.pulses: List[Optional[PulseList]] = [None] * len(base_freqs)
+        self._add_pulse: List[Optional[Callable[..., None]]] = [None] * len(
+            base_freqs
+        )
+
+    def total_freq(self, channel: int) -> float:
+        return self.base_freq[channel] + self.delta_freq[channel]
 
     def shift_freq(self, channel: int, delta: float, time: float) -> None:
-        self.channels[channel].shift_freq(delta, time)
+        self.phase[channel] -= delta * time
+        self.delta_freq[channel] += delta
 
     def set_freq(self, channel: int, freq: float, time: float) -> None:
-        self.channels[channel].set_freq(freq, time)
+        self.phase[channel] -= (freq - self.delta_freq[channel]) * time
+        self.delta_freq[channel] = freq
 
     def shift_phase(self, channel: int, delta: float) -> None:
-        self.channels[channel].shift_phase(delta)
+        self.phase[channel] += delta
 
     def set_phase(self, channel: int, phase: float, time: float) -> None:
-        self.channels[channel].set_phase(phase, time)
+        self.phase[channel] = phase - self.delta_freq[channel] * time
 
     def swap_phase(self, a: int, b: int, time: float) -> None:
-        _ChannelStatus.swap_phase(self.channels[a], self.channels[b], time)
+        diff = self.total_freq(a) - self.total_freq(b)
+        phase = self.phase
+        phase[a], phase[b] = phase[b] - diff * time, phase[a] + diff * time
 
     def play(
         self,
@@ -66,11 +46,36 @@ class PhaseTracker:
         drag_coef: float,
         time: float,
     ):
-        freq_g = self.channels[channel].total_freq
-        total_phase = self.channels[channel].phase + phase
-        self.channels[channel].pulses.add_pulse(
-            env, freq_g, freq, time, total_phase, amp, drag_coef
+        freq_g = self.base_freq[channel] + self.delta_freq[channel]
+        total_phase = self.phase[channel] + phase
+        add_pulse = self._add_pulse[channel]
+        if add_pulse is None:
+            add_pulse = self._add_pulse[channel] = self._pulses(channel).add_pulse
+        add_pulse(env, freq_g, freq, time, total_phase, amp, drag_coef)
+
+    def play_strided(
+        self,
+        channel: int,
+        env: Envelope,
+        freq: float,
+        phase: float,
+        amp: float,
+        drag_coef: float,
+        time: float,
+        stride: float,
+        count: int,
+    ) -> None:
+        freq_g = self.base_freq[channel] + self.delta_freq[channel]
+        total_phase = self.phase[channel] + phase
+        self._pulses(channel).add_pulses_strided(
+            env, freq_g, freq, time, stride, count, total_phase, amp, drag_coef
         )
 
     def finish(self) -> List[PulseList]:
-        return [ch.pulses for ch in self.channels]
+        return [PulseList() if p is None else p for p in self.pulses]
+
+    def _pulses(self, channel: int) -> PulseList:
+        pulses = self.pulses[channel]
+        if pulses is None:
+            pulses = self.pulses[channel] = PulseList()
+        return pulses
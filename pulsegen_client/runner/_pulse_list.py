@@ -64,6 +64,36 @@ class PulseList(MutableSequence[PulseItem]):
             )
         )
 
+    def add_pulses_strided(
+        self,
+        env: Envelope,
+        freq_g: float,
+        freq_l: float,
+        time: float,
+        stride: float,
+        count: int,
+        phase: float,
+        amp: float,
+        drag_coef: float,
+    ) -> None:
+        if amp == 0:
+            return
+        camp = cmath.rect(amp, math.tau * phase)
+        cdrag = 1j * camp * drag_coef
+        items = self._items
+        for i in range(count):
+            items.append(
+                PulseItem(
+                    time=time + i * stride,
+                    envelope=env,
+                    amp=camp,
+                    drag_amp=cdrag,
+                    freq_g=freq_g,
+                    freq_l=freq_l,
+                    delay=0,
+                )
+            )
+
     def delay(self, delay: float) -> None:
         self._items = [
             PulseItem(
@@ -19,7 +19,7 @@ def run_schedule(request: schedule.Request) -> Dict[str, Tuple[np.ndarray, np.nd
     channels = request.channels
     shapes = [get_shape(shape) for shape in request.shapes]
     phase_tracker = PhaseTracker([ch.base_freq for ch in channels])
-    lm = _layout.create_layout_manager(request.schedule)
+    lm = _layout.create_layout_manager(request.canonical().schedule)
     lm.measure(math.inf)
     assert lm.desired_duration is not None
     lm.arrange(0.0, lm.desired_duration)
@@ -1,16 +1,20 @@
 """Classes for pulse scheduling."""
 
 import enum as _enum
+import functools as _functools
 import math as _math
 import typing as _typing
+import weakref as _weakref
 
 import attrs as _attrs
+import numpy as _np
+import numpy.typing as _npt
 
 import pulsegen_client.contracts as _cts
 import pulsegen_client.shape as _shape
 
 
-class Alignment(_enum.Enum):
+class Alignment(_enum.IntEnum):
     """Alignment of a schedule element."""
 
     END = 0
@@ -23,12 +27,19 @@ class Alignment(_enum.Enum):
     """Stretch to fill parent element."""
 
 
+_ALIGNMENT_NAMES = {name.lower(): m for name, m in Alignment.__members__.items()}
+
+_DEFAULT_MARGIN = (0, 0)
+
+
 def _convert_margin(
     margin: _typing.Union[float, _typing.Tuple[float, float]]
 ) -> _typing.Tuple[float, float]:
-    if not isinstance(margin, tuple):
-        margin = (margin, margin)
-    return margin
+    if margin is _DEFAULT_MARGIN:
+        return margin
+    if isinstance(margin, tuple):
+        return margin
+    return (margin, margin)
 
 
 def _convert_alignment(
@@ -36,6 +47,11 @@ def _convert_alignment(
         _typing.Literal["end", "start", "center", "stretch"], Alignment
     ]
 ) -> Alignment:
+    if type(alignment) is Alignment:
+        return alignment
+    member = _ALIGNMENT_NAMES.get(alignment)  # type: ignore
+    if member is not None:
+        return member
     if isinstance(alignment, str):
         return Alignment[alignment.upper()]
     return alignment
@@ -60,7 +76,7 @@ class Element(_cts.UnionObject):
     """
 
     margin: _typing.Tuple[float, float] = _attrs.field(
-        kw_only=True, default=(0, 0), converter=_convert_margin
+        kw_only=True, default=_DEFAULT_MARGIN, converter=_convert_margin
     )
     """The margin of the element."""
     alignment: Alignment = _attrs.field(
@@ -76,8 +92,30 @@ class Element(_cts.UnionObject):
     min_duration: float = _attrs.field(kw_only=True, default=0)
     """Minimum duration of the element."""
 
+    def intern(self) -> "Element":
+        """Get a shared instance equal to this element.
 
-@_attrs.frozen
+        Structurally equal elements interned this way are the same object as
+        long as one of them is alive.
+
+        :return: The shared instance.
+        """
+        ref = _INTERNED.get(self)
+        shared = None if ref is None else ref()
+        if shared is not None:
+            return shared
+        _INTERNED[self] = _weakref.ref(self)
+        return self
+
+
+# Keyed by the elements themselves so that hash collisions are resolved by
+# equality. The values are weak references back to the keys.
+_INTERNED: "_weakref.WeakKeyDictionary[Element, _weakref.ref]" = (
+    _weakref.WeakKeyDictionary()
+)
+
+
+@_attrs.frozen(cache_hash=True)
 class Play(Element):
     """A pulse play element.
 
@@ -126,8 +164,48 @@ class Play(Element):
     flexible: bool = _attrs.field(kw_only=True, default=False)
     """Whether the plateau can be shortened or extended."""
 
+    @classmethod
+    def many(
+        cls,
+        channel_id: _npt.ArrayLike,
+        amplitude: _npt.ArrayLike,
+        shape_id: _npt.ArrayLike,
+        width: _npt.ArrayLike,
+        *,
+        plateau: _npt.ArrayLike = 0,
+        drag_coef: _npt.ArrayLike = 0,
+        frequency: _npt.ArrayLike = 0,
+        phase: _npt.ArrayLike = 0,
+        **kwargs: _typing.Any,
+    ) -> _typing.List["Play"]:
+        """Create many pulses at once from arrays.
+
+        The pulse parameters are broadcast against each other.
+
+        :param channel_id: Target channel IDs.
+        :param amplitude: Amplitudes of the pulses.
+        :param shape_id: Shape IDs of the pulses.
+        :param width: Widths of the pulses.
+        :param plateau: Plateaus of the pulses.
+        :param drag_coef: Drag coefficients of the pulses.
+        :param frequency: Frequencies of the pulses.
+        :param phase: Phases of the pulses in **cycles**.
+        :param kwargs: Other parameters shared by all pulses, e.g. ``flexible``
+            or ``margin``.
+        :return: The created pulses.
+        """
+        arrays = _np.broadcast_arrays(
+            channel_id, amplitude, shape_id, width, plateau, drag_coef, frequency, phase
+        )
+        return [
+            cls(c, a, s, w, plateau=p, drag_coef=d, frequency=f, phase=ph, **kwargs)
+            for c, a, s, w, p, d, f, ph in zip(
+                *(array.ravel().tolist() for array in arrays)
+            )
+        ]
+
 
-@_attrs.frozen
+@_attrs.frozen(cache_hash=True)
 class ShiftPhase(Element):
     """A phase shift element.
 
@@ -152,7 +230,7 @@ class ShiftPhase(Element):
     """Delta phase in **cycles**."""
 
 
-@_attrs.frozen
+@_attrs.frozen(cache_hash=True)
 class SetPhase(Element):
     """A phase set element.
 
@@ -180,7 +258,7 @@ class SetPhase(Element):
     """Target phase in **cycles**."""
 
 
-@_attrs.frozen
+@_attrs.frozen(cache_hash=True)
 class ShiftFrequency(Element):
     """A frequency shift element.
 
@@ -205,7 +283,7 @@ class ShiftFrequency(Element):
     """Delta frequency."""
 
 
-@_attrs.frozen
+@_attrs.frozen(cache_hash=True)
 class SetFrequency(Element):
     """A frequency set element.
 
@@ -230,7 +308,7 @@ class SetFrequency(Element):
     """Target frequency."""
 
 
-@_attrs.frozen
+@_attrs.frozen(cache_hash=True)
 class SwapPhase(Element):
     """A phase swap element.
 
@@ -268,7 +346,13 @@ class SwapPhase(Element):
     """Target channel ID 2."""
 
 
-@_attrs.frozen
+def _convert_channel_ids(channel_ids: _typing.Iterable[int]) -> _np.ndarray:
+    array = _np.array(channel_ids, dtype=_np.int32)
+    array.flags.writeable = False
+    return array
+
+
+@_attrs.frozen(cache_hash=True)
 class Barrier(Element):
     """A barrier element.
 
@@ -292,7 +376,9 @@ class Barrier(Element):
 
     TYPE_ID = 6
 
-    channel_ids: _typing.List[int] = _attrs.field(converter=list, factory=list)
+    channel_ids: _np.ndarray = _attrs.field(
+        converter=_convert_channel_ids, factory=list, eq=tuple
+    )
     """Target channel IDs."""
 
 
@@ -300,6 +386,10 @@ class Barrier(Element):
 class Repeat(Element):
     """A repeated schedule element.
 
+    A nested repeat without spacing, margin or duration constraints is folded
+    into a single repeat when its child always fills its slot, e.g. a
+    :class:`Stack`.
+
     :param element: The repeated element.
     :param count: The number of repetitions.
     :param spacing: The spacing between repeated elements.
@@ -323,8 +413,37 @@ class Repeat(Element):
     spacing: float = _attrs.field(kw_only=True, default=0)
     """The spacing between repeated elements."""
 
+    def __attrs_post_init__(self) -> None:
+        # Repeat(Repeat(x, a), b) without spacing lays out exactly like
+        # Repeat(x, a * b) when x always fills its slot.
+        child = self.child
+        if (
+            isinstance(child, Repeat)
+            and self.spacing == 0
+            and child.spacing == 0
+            and child.visibility
+            and _is_plain(child)
+            and _fills_slot(child.child)
+        ):
+            object.__setattr__(self, "child", child.child)
+            object.__setattr__(self, "count", self.count * child.count)
+
+
+def tile(unit: Element, count: int, spacing: float = 0) -> Repeat:
+    """Repeat a unit schedule ``count`` times.
+
+    The unit is stored once and repeated by the layout, so this is preferred
+    over passing ``[unit] * count`` to :meth:`Stack.with_children`.
+
+    :param unit: The repeated element.
+    :param count: The number of repetitions.
+    :param spacing: The spacing between repeated elements.
+    :return: The repeated schedule element.
+    """
+    return Repeat(unit, count, spacing=spacing)
 
-class ArrangeDirection(_enum.Enum):
+
+class ArrangeDirection(_enum.IntEnum):
     """Direction of arrangement."""
 
     BACKWARDS = 0
@@ -333,14 +452,65 @@ class ArrangeDirection(_enum.Enum):
     """Arrange from the start of the schedule."""
 
 
+_DIRECTION_NAMES = {
+    name.lower(): m for name, m in ArrangeDirection.__members__.items()
+}
+
+
 def _convert_direction(
     direction: _typing.Union[_typing.Literal["backwards", "forwards"], ArrangeDirection]
 ) -> ArrangeDirection:
+    if type(direction) is ArrangeDirection:
+        return direction
+    member = _DIRECTION_NAMES.get(direction)  # type: ignore
+    if member is not None:
+        return member
     if isinstance(direction, str):
         return ArrangeDirection[direction.upper()]
     return direction
 
 
+_REPR_CHILDREN = 3
+
+
+def _repr_children(children: _typing.Tuple[_typing.Any, ...]) -> str:
+    if len(children) <= _REPR_CHILDREN:
+        return repr(children)
+    shown = ", ".join(repr(child) for child in children[:_REPR_CHILDREN])
+    return f"({shown}, <{len(children) - _REPR_CHILDREN} more>)"
+
+
+def _maybe_tuple(
+    items: _typing.Iterable[_typing.Any]
+) -> _typing.Tuple[_typing.Any, ...]:
+    if type(items) is tuple:
+        return items
+    return tuple(items)
+
+
+@_functools.lru_cache(maxsize=None)
+def _field_names(cls: type) -> _typing.Tuple[str, ...]:
+    return tuple(field.name for field in _attrs.fields(cls))
+
+
+_ElementT = _typing.TypeVar("_ElementT", bound="Element")
+
+
+def _replace_children(
+    element: _ElementT, children: _typing.Tuple[_typing.Any, ...]
+) -> _ElementT:
+    """Copy a container element with already converted children.
+
+    Unlike :func:`attrs.evolve`, no converter is run again on any field.
+    """
+    new = object.__new__(type(element))
+    setattr_ = object.__setattr__
+    for name in _field_names(type(element)):
+        setattr_(new, name, getattr(element, name))
+    setattr_(new, "children", children)
+    return new
+
+
 @_attrs.frozen
 class Stack(Element):
     """Layout child elements in one direction.
@@ -364,7 +534,9 @@ class Stack(Element):
 
     TYPE_ID = 8
 
-    children: _typing.List[Element] = _attrs.field(converter=list, factory=list)
+    children: _typing.Tuple[Element, ...] = _attrs.field(
+        converter=_maybe_tuple, factory=tuple, repr=_repr_children
+    )
     """Child elements."""
     direction: ArrangeDirection = _attrs.field(
         kw_only=True, default=ArrangeDirection.BACKWARDS, converter=_convert_direction
@@ -377,7 +549,7 @@ class Stack(Element):
         :param children: The new children.
         :return: The new stack.
         """
-        return _attrs.evolve(self, children=children)
+        return _replace_children(self, children)
 
 
 @_attrs.frozen
@@ -406,11 +578,15 @@ class AbsoluteEntry(_cts.MsgObject):
 
 
 def _convert_abs_entries(
-    entries: _typing.List[
+    entries: _typing.Iterable[
         _typing.Union[Element, _typing.Tuple[float, Element], AbsoluteEntry]
     ]
-) -> _typing.List[AbsoluteEntry]:
-    return [AbsoluteEntry.from_tuple(obj) for obj in entries]
+) -> _typing.Tuple[AbsoluteEntry, ...]:
+    if type(entries) is tuple and all(type(e) is AbsoluteEntry for e in entries):
+        return entries
+    builders = _ABS_ENTRY_BUILDERS
+    fallback = AbsoluteEntry.from_tuple
+    return tuple([builders.get(type(obj), fallback)(obj) for obj in entries])
 
 
 @_attrs.frozen
@@ -438,8 +614,8 @@ class Absolute(Element):
 
     TYPE_ID = 9
 
-    children: _typing.List[AbsoluteEntry] = _attrs.field(
-        converter=_convert_abs_entries, factory=list
+    children: _typing.Tuple[AbsoluteEntry, ...] = _attrs.field(
+        converter=_convert_abs_entries, factory=tuple, repr=_repr_children
     )
     """Child elements with absolute timing."""
 
@@ -451,10 +627,29 @@ class Absolute(Element):
         :param children: The new children.
         :return: The new absolute schedule.
         """
-        return _attrs.evolve(self, children=children)
+        return _replace_children(self, _convert_abs_entries(children))
+
+    def with_times(
+        self, times: _npt.ArrayLike, elements: _typing.Sequence[Element]
+    ) -> "Absolute":
+        """Create a new absolute schedule placing elements at given times.
+
+        This is the array counterpart of :meth:`with_children`, e.g. for the
+        pulses created by :meth:`Play.many`.
+
+        :param times: Time of each element.
+        :param elements: The new child elements.
+        :return: The new absolute schedule.
+        """
+        time_list = _np.asarray(times, dtype=_np.float64).ravel().tolist()
+        if len(time_list) != len(elements):
+            raise ValueError(
+                f"Got {len(time_list)} times for {len(elements)} elements."
+            )
+        return _replace_children(self, tuple(map(AbsoluteEntry, time_list, elements)))
 
 
-class GridLengthUnit(_enum.Enum):
+class GridLengthUnit(_enum.IntEnum):
     """Unit of grid length."""
 
     SECOND = 0
@@ -485,7 +680,7 @@ class GridLength(_cts.MsgObject):
     @classmethod
     def auto(cls) -> "GridLength":
         """Create an automatic grid length."""
-        return cls(value=_math.nan, unit=GridLengthUnit.AUTO)
+        return _GRID_AUTO
 
     @classmethod
     def star(cls, value: float) -> "GridLength":
@@ -519,11 +714,22 @@ class GridLength(_cts.MsgObject):
         """
         if isinstance(value, (float, int)):
             return cls.abs(value)
+        return cls._parse_str(value)
+
+    @staticmethod
+    @_functools.lru_cache(maxsize=256)
+    def _parse_str(value: str) -> "GridLength":
         if value.lower() == "auto":
-            return cls.auto()
+            return GridLength.auto()
         if value.endswith("*"):
-            return cls.star(float(value[:-1]))
-        return cls.abs(float(value))
+            if value == "*":
+                return _GRID_STAR
+            return GridLength.star(float(value[:-1]))
+        return GridLength.abs(float(value))
+
+
+_GRID_AUTO = GridLength(value=_math.nan, unit=GridLengthUnit.AUTO)
+_GRID_STAR = GridLength(value=1.0, unit=GridLengthUnit.STAR)
 
 
 @_attrs.frozen
@@ -561,7 +767,7 @@ class GridEntry(_cts.MsgObject):
 
 
 def _convert_grid_entries(
-    entries: _typing.List[
+    entries: _typing.Iterable[
         _typing.Union[
             Element,
             _typing.Tuple[int, Element],
@@ -569,17 +775,28 @@ def _convert_grid_entries(
             GridEntry,
         ]
     ]
-) -> _typing.List[GridEntry]:
-    return [GridEntry.from_tuple(obj) for obj in entries]
+) -> _typing.Tuple[GridEntry, ...]:
+    if type(entries) is tuple and all(type(e) is GridEntry for e in entries):
+        return entries
+    builders = _GRID_ENTRY_BUILDERS
+    fallback = GridEntry.from_tuple
+    return tuple([builders.get(type(obj), fallback)(obj) for obj in entries])
 
 
 def _convert_columns(
-    columns: _typing.List[_typing.Union[GridLength, str, float]]
-) -> _typing.List[GridLength]:
-    return [
-        GridLength.parse(column) if not isinstance(column, GridLength) else column
-        for column in columns
-    ]
+    columns: _typing.Iterable[_typing.Union[GridLength, str, float]]
+) -> _typing.Tuple[GridLength, ...]:
+    if type(columns) is tuple and all(type(c) is GridLength for c in columns):
+        return columns
+    return tuple(map(_convert_column, columns))
+
+
+def _convert_column(column: _typing.Union[GridLength, str, float]) -> GridLength:
+    if type(column) is str:
+        return GridLength._parse_str(column)
+    if isinstance(column, GridLength):
+        return column
+    return GridLength.parse(column)
 
 
 @_attrs.frozen
@@ -608,12 +825,12 @@ class Grid(Element):
 
     TYPE_ID = 10
 
-    children: _typing.List[GridEntry] = _attrs.field(
-        converter=_convert_grid_entries, factory=list
+    children: _typing.Tuple[GridEntry, ...] = _attrs.field(
+        converter=_convert_grid_entries, factory=tuple, repr=_repr_children
     )
     """Child elements with grid positioning."""
-    columns: _typing.List[GridLength] = _attrs.field(
-        converter=_convert_columns, factory=list
+    columns: _typing.Tuple[GridLength, ...] = _attrs.field(
+        converter=_convert_columns, factory=tuple
     )
     """Definitions of grid columns."""
 
@@ -630,7 +847,171 @@ class Grid(Element):
         :param children: The new children.
         :return: The new grid schedule.
         """
-        return _attrs.evolve(self, children=children)
+        return _replace_children(self, _convert_grid_entries(children))
+
+
+_ELEMENT_TYPES = (
+    Play,
+    ShiftPhase,
+    SetPhase,
+    ShiftFrequency,
+    SetFrequency,
+    SwapPhase,
+    Barrier,
+    Repeat,
+    Stack,
+    Absolute,
+    Grid,
+)
+
+
+def _grid_entry_from_tuple(obj: tuple) -> GridEntry:
+    if len(obj) == 2:
+        return GridEntry(obj[0], 1, obj[1])
+    return GridEntry(obj[0], obj[1], obj[2])
+
+
+# Entry builders keyed by the exact type of the item; other types fall back to
+# the from_tuple methods.
+_ABS_ENTRY_BUILDERS = {
+    AbsoluteEntry: lambda obj: obj,
+    tuple: lambda obj: AbsoluteEntry(obj[0], obj[1]),
+    **dict.fromkeys(_ELEMENT_TYPES, lambda obj: AbsoluteEntry(0, obj)),
+}
+_GRID_ENTRY_BUILDERS = {
+    GridEntry: lambda obj: obj,
+    tuple: _grid_entry_from_tuple,
+    **dict.fromkeys(_ELEMENT_TYPES, lambda obj: GridEntry(0, 1, obj)),
+}
+
+
+def _is_plain(element: Element) -> bool:
+    """Whether the element has no margin and no duration constraints."""
+    return (
+        element.margin == _DEFAULT_MARGIN
+        and element.duration is None
+        and element.min_duration == 0
+        and element.max_duration == _math.inf
+    )
+
+
+def _fills_slot(element: Element) -> bool:
+    """Whether the element always takes the whole duration it is arranged in."""
+    if isinstance(element, Play):
+        return element.flexible and _is_plain(element)
+    return isinstance(element, (Repeat, Stack, Absolute, Grid)) and _is_plain(element)
+
+
+def _coalesce_shift_phase(
+    children: _typing.Iterable[Element]
+) -> _typing.Tuple[Element, ...]:
+    result: _typing.List[Element] = []
+    for child in children:
+        prev = result[-1] if result else None
+        if (
+            type(child) is ShiftPhase
+            and type(prev) is ShiftPhase
+            and child.channel_id == prev.channel_id
+            and child.visibility
+            and prev.visibility
+            and _is_plain(child)
+            and _is_plain(prev)
+        ):
+            result[-1] = _attrs.evolve(prev, phase=prev.phase + child.phase)
+        else:
+            result.append(child)
+    return tuple(result)
+
+
+def _same_items(
+    a: _typing.Sequence[_typing.Any], b: _typing.Sequence[_typing.Any]
+) -> bool:
+    return len(a) == len(b) and all(x is y for x, y in zip(a, b))
+
+
+def _canonicalize(element: Element, arranged_as_desired: bool) -> Element:
+    """Return an equivalent element with redundant nodes removed.
+
+    :param element: The element to canonicalize.
+    :param arranged_as_desired: Whether the parent always arranges the element
+        with its desired duration, as :class:`Stack` and :class:`Absolute` do.
+    """
+    if not element.visibility and element.duration and _child_elements(element):
+        # The subtree is never rendered and its duration does not depend on
+        # its content, so only the channels it occupies matter.
+        return Barrier(
+            sorted(_channel_ids(element)),
+            margin=element.margin,
+            alignment=element.alignment,
+            visibility=False,
+            duration=element.duration,
+            max_duration=element.max_duration,
+            min_duration=element.min_duration,
+        )
+    if isinstance(element, Stack):
+        children = _coalesce_shift_phase(
+            _canonicalize(child, True) for child in element.children
+        )
+        if (
+            len(children) == 1
+            and arranged_as_desired
+            and element.visibility
+            and _is_plain(element)
+        ):
+            return children[0]
+        if _same_items(children, element.children):
+            return element
+        return _replace_children(element, children)
+    if isinstance(element, Absolute):
+        entries = tuple(
+            AbsoluteEntry(entry.time, _canonicalize(entry.element, True))
+            for entry in element.children
+        )
+        if _same_items(
+            [e.element for e in entries], [e.element for e in element.children]
+        ):
+            return element
+        return _replace_children(element, entries)
+    if isinstance(element, Grid):
+        entries = tuple(
+            GridEntry(entry.column, entry.span, _canonicalize(entry.element, False))
+            for entry in element.children
+        )
+        if _same_items(
+            [e.element for e in entries], [e.element for e in element.children]
+        ):
+            return element
+        return _replace_children(element, entries)
+    if isinstance(element, Repeat):
+        child = _canonicalize(element.child, False)
+        if child is element.child:
+            return element
+        # Construction folds the new child if it became a nested repeat.
+        return _attrs.evolve(element, child=child)
+    return element
+
+
+def _channel_ids(element: Element) -> _typing.Set[int]:
+    """Channels occupied by an element when it is placed in a :class:`Stack`."""
+    if isinstance(element, Play):
+        return {element.channel_id}
+    if isinstance(element, (ShiftPhase, SetPhase, ShiftFrequency, SetFrequency)):
+        return {element.channel_id}
+    if isinstance(element, SwapPhase):
+        return {element.channel_id1, element.channel_id2}
+    if isinstance(element, Barrier):
+        return set(element.channel_ids.tolist())
+    return set().union(*map(_channel_ids, _child_elements(element)))
+
+
+def _child_elements(element: Element) -> _typing.Sequence[Element]:
+    if isinstance(element, Stack):
+        return element.children
+    if isinstance(element, (Absolute, Grid)):
+        return [entry.element for entry in element.children]
+    if isinstance(element, Repeat):
+        return (element.child,)
+    return ()
 
 
 @_attrs.frozen
@@ -651,3 +1032,43 @@ class Request(_cts.MsgObject):
     """The root element of the schedule."""
     options: _cts.Options = _attrs.field(factory=_cts.Options)
     """Options for the PulseGen service."""
+    _canonical: _typing.Optional["Request"] = _attrs.field(
+        init=False, default=None, eq=False, repr=False
+    )
+
+    def canonical(self) -> "Request":
+        """Get an equivalent request with a simplified schedule.
+
+        Consecutive :class:`ShiftPhase` on the same channel in a :class:`Stack`
+        are merged, single-child stacks are unwrapped where the layout allows it
+        and nested :class:`Repeat` without spacing are folded into one.
+        Invisible containers with a fixed duration are replaced by a
+        :class:`Barrier` on the channels they occupy. The result is computed
+        once and cached on the request.
+
+        :return: The canonical request.
+        """
+        if self._canonical is None:
+            schedule = _canonicalize(self.schedule, True)
+            if schedule is self.schedule:
+                canonical = self
+            else:
+                canonical = _attrs.evolve(self, schedule=schedule)
+                object.__setattr__(canonical, "_canonical", canonical)
+            object.__setattr__(self, "_canonical", canonical)
+        return self._canonical
+
+    def packb(self) -> bytes:
+        """Serialize the request to bytes in msgpack format.
+
+        Channel and shape information is usually shared by many requests, so
+        their encoded bytes are cached for as long as the objects are alive.
+        """
+        # Same layout as the generic encoder: an array of the fields in order.
+        fields = (
+            _cts.packb_array_cached(self.channels),
+            _cts.packb_array_cached(self.shapes),
+            self.schedule.packb(),
+            self.options.packb(),
+        )
+        return _cts.packb_array_header(len(fields)) + b"".join(fields)
@@ -36,7 +36,7 @@ class InterpolatedShape(ShapeInfo):
 
     TYPE_ID = 2
 
-    x_array: _typing.List[float] = _attrs.field(converter=list)
+    x_array: _typing.Tuple[float, ...] = _attrs.field(converter=tuple)
     """The x values of the shape."""
-    y_array: _typing.List[float] = _attrs.field(converter=list)
+    y_array: _typing.Tuple[float, ...] = _attrs.field(converter=tuple)
     """The y values of the shape."""